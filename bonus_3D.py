@@ -4,10 +4,11 @@ from OpenGL.GL import *
 from OpenGL.GLU import *
 import math
 import sys
-from main import allowed_moves
+from main import MOVE_RE
 
 CUBE_GAP = 1.1
 ROT_STEP = 3
+AXIS_INDEX = {'x': 0, 'y': 1, 'z': 2}
 
 COLOR_MAP = {
     'W': (1, 1, 1),
@@ -56,6 +57,43 @@ def draw_cube(size=0.45, colors=None):
             glVertex3fv(vertices[v])
     glEnd()
 
+def face_rotation(axis, direction):
+    """Map each cubie face label to the face it lands on after a quarter turn."""
+    angle = math.radians(90 * direction)
+    s = math.sin(angle)
+    c = math.cos(angle)
+
+    def rot(vec):
+        x, y, z = vec
+        if axis == 'x':
+            return (x, y * c - z * s, y * s + z * c)
+        if axis == 'y':
+            return (x * c + z * s, y, -x * s + z * c)
+        if axis == 'z':
+            return (x * c - y * s, x * s + y * c, z)
+
+    normals = {
+        'U': (0, 1, 0), 'D': (0, -1, 0),
+        'F': (0, 0, 1), 'B': (0, 0, -1),
+        'R': (1, 0, 0), 'L': (-1, 0, 0),
+    }
+
+    mapping = {}
+    for label, vec in normals.items():
+        rx, ry, rz = rot(vec)
+        if abs(rx) > 0.5:
+            tgt = 'R' if rx > 0 else 'L'
+        elif abs(ry) > 0.5:
+            tgt = 'U' if ry > 0 else 'D'
+        else:
+            tgt = 'F' if rz > 0 else 'B'
+        mapping[label] = tgt
+    return mapping
+
+# only 6 quarter turns exist: compute them once instead of per cubie and per move
+FACE_ROTATION = {(axis, direction): face_rotation(axis, direction)
+                 for axis in 'xyz' for direction in (1, -1)}
+
 class Cubie:
     def __init__(self, x, y, z):
         self.pos = [x, y, z]
@@ -71,38 +109,8 @@ class Cubie:
         }
 
     def rotate_faces(self, axis, direction=1):
-        old = self.faces.copy()
-        new = {k: None for k in old}
-        angle = math.radians(90 * direction)
-        s = math.sin(angle)
-        c = math.cos(angle)
-
-        def rot(vec):
-            x, y, z = vec
-            if axis == 'x':
-                return (x, y * c - z * s, y * s + z * c)
-            if axis == 'y':
-                return (x * c + z * s, y, -x * s + z * c)
-            if axis == 'z':
-                return (x * c - y * s, x * s + y * c, z)
-
-        normals = {
-            'U': (0, 1, 0), 'D': (0, -1, 0),
-            'F': (0, 0, 1), 'B': (0, 0, -1),
-            'R': (1, 0, 0), 'L': (-1, 0, 0),
-        }
-
-        for label, vec in normals.items():
-            rx, ry, rz = rot(vec)
-            if abs(rx) > 0.5:
-                tgt = 'R' if rx > 0 else 'L'
-            elif abs(ry) > 0.5:
-                tgt = 'U' if ry > 0 else 'D'
-            else:
-                tgt = 'F' if rz > 0 else 'B'
-            new[tgt] = old[label]
-
-        self.faces = new
+        old = self.faces
+        self.faces = {tgt: old[label] for label, tgt in FACE_ROTATION[axis, direction].items()}
 
     def draw(self):
         glPushMatrix()
@@ -115,7 +123,7 @@ class Cubie:
 
 def rotate_face(cubies, axis, layer, step, direction=1):
     rad = math.radians(step * direction)
-    idx = 'xyz'.index(axis)
+    idx = AXIS_INDEX[axis]
 
     for c in cubies:
         if round(c.pos[idx] / CUBE_GAP) == layer:
@@ -314,7 +322,7 @@ def main(shuffle, solution):
                 for c in cubies:
                     c.pos = [round(v / CUBE_GAP) * CUBE_GAP for v in c.pos]
                     c.rot = [0, 0, 0]
-                    if round(c.pos['xyz'.index(axis)] / CUBE_GAP) == layer:
+                    if round(c.pos[AXIS_INDEX[axis]] / CUBE_GAP) == layer:
                         c.rotate_faces(axis, direction)
                 axis = layer = None
 
@@ -334,11 +342,11 @@ if __name__ == "__main__":
         sys.exit(1)
     shuffle = sys.argv[1] if len(sys.argv) >= 2 else ""
     solution = sys.argv[2] if len(sys.argv) >= 3 else ""
-    invalid_moves = [move for move in shuffle.split() if move not in allowed_moves]
+    invalid_moves = [move for move in shuffle.split() if not MOVE_RE.fullmatch(move)]
     if invalid_moves:
         print(f"Invalid moves found: {', '.join(invalid_moves)}")
         sys.exit(1)
-    invalid_moves = [move for move in solution.split() if move not in allowed_moves]
+    invalid_moves = [move for move in solution.split() if not MOVE_RE.fullmatch(move)]
     if invalid_moves:
         print(f"Invalid moves found: {', '.join(invalid_moves)}")
         sys.exit(1)
@@ -4,8 +4,35 @@ Module partagé entre solver_kociemba.py et solver_kociemba_fast.py.
 """
 
 import os
+import json
+import mmap
 import time
 import pickle
+from array import array
+
+
+# Tables de mouvement (listes Python, sérialisées une par fichier)
+MOVE_TABLE_NAMES = (
+    'twist_move',
+    'flip_move',
+    'FRtoBR_move',
+    'slice_move',
+    'URFtoDLF_move',
+    'URtoUL_move',
+    'UBtoDF_move',
+    'URtoDF_move',
+    'merge_URtoUL_UBtoDF_flat',
+)
+
+# Tables de pruning (bytearray, écrites brutes et mappées en mémoire)
+PRUNING_TABLE_NAMES = (
+    'slice_flip_prun',
+    'slice_twist_prun',
+    'slice_URFtoDLF_parity_prun',
+    'slice_URtoDF_parity_prun',
+)
+
+MANIFEST_FILE = "manifest.json"
 
 
 def get_pruning(table, index):
@@ -53,15 +80,46 @@ class KociembaTablesConfig:
         self.BR = BR
 
 
+class _LazyTable:
+    """Table chargée depuis le cache au premier accès (puis mémorisée)."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = obj._load_table(self.name)
+        obj.__dict__[self.name] = value
+        return value
+
+
 class Tables:
+    # Chaque table n'est lue sur disque qu'au moment où la recherche en a
+    # besoin : la phase 1 ne touche que twist/flip/slice et les deux
+    # tables slice_*_prun, les tables de phase 2 arrivent plus tard.
+    twist_move = _LazyTable()
+    flip_move = _LazyTable()
+    FRtoBR_move = _LazyTable()
+    slice_move = _LazyTable()
+    URFtoDLF_move = _LazyTable()
+    URtoUL_move = _LazyTable()
+    UBtoDF_move = _LazyTable()
+    URtoDF_move = _LazyTable()
+    merge_URtoUL_UBtoDF_flat = _LazyTable()
+    slice_flip_prun = _LazyTable()
+    slice_twist_prun = _LazyTable()
+    slice_URFtoDLF_parity_prun = _LazyTable()
+    slice_URtoDF_parity_prun = _LazyTable()
+
     def __init__(
         self,
         cube_class,
         move_cube,
         parity_move,
         config: KociembaTablesConfig,
-        cache_file=None,
-        cache_version="1.0",
+        cache_dir=None,
+        cache_version="2.2",
         generate_if_missing=True,
         verbose=True,
     ):
@@ -72,22 +130,9 @@ class Tables:
         self.CACHE_VERSION = cache_version
         self._verbose = verbose
 
-        if cache_file is None:
-            cache_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "kociemba_tables.pkl")
-        self.CACHE_FILE = cache_file
-
-        self.twist_move = None
-        self.flip_move = None
-        self.FRtoBR_move = None
-        self.URFtoDLF_move = None
-        self.URtoUL_move = None
-        self.UBtoDF_move = None
-        self.URtoDF_move = None
-        self.merge_URtoUL_UBtoDF = None
-        self.slice_flip_prun = None
-        self.slice_twist_prun = None
-        self.slice_URFtoDLF_parity_prun = None
-        self.slice_URtoDF_parity_prun = None
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "kociemba_cache")
+        self.CACHE_DIR = cache_dir
 
         if not self._load_from_cache():
             if not generate_if_missing:
@@ -99,65 +144,105 @@ class Tables:
         if self._verbose:
             print(msg)
 
+    def _table_layouts(self):
+        """Forme et type attendus de chaque table, décrits dans le manifeste"""
+        cfg = self._cfg
+        return {
+            'twist_move': ([cfg.N_TWIST, cfg.N_MOVE], 'list'),
+            'flip_move': ([cfg.N_FLIP, cfg.N_MOVE], 'list'),
+            'FRtoBR_move': ([cfg.N_FRtoBR, cfg.N_MOVE], 'list'),
+            'slice_move': ([cfg.N_SLICE1, cfg.N_MOVE], 'list'),
+            'URFtoDLF_move': ([cfg.N_URFtoDLF, cfg.N_MOVE], 'list'),
+            'URtoUL_move': ([cfg.N_URtoUL, cfg.N_MOVE], 'list'),
+            'UBtoDF_move': ([cfg.N_UBtoDF, cfg.N_MOVE], 'list'),
+            'URtoDF_move': ([cfg.N_URtoDF, cfg.N_MOVE], 'list'),
+            'merge_URtoUL_UBtoDF_flat': ([336 * 336], 'int16'),
+            # Pruning: une valeur de 4 bits par état, deux par octet
+            'slice_flip_prun': ([cfg.N_SLICE1 * cfg.N_FLIP], 'uint4'),
+            'slice_twist_prun': ([cfg.N_SLICE1 * cfg.N_TWIST], 'uint4'),
+            'slice_URFtoDLF_parity_prun': ([cfg.N_SLICE2 * cfg.N_URFtoDLF * cfg.N_PARITY], 'uint4'),
+            'slice_URtoDF_parity_prun': ([cfg.N_SLICE2 * cfg.N_URtoDF * cfg.N_PARITY], 'uint4'),
+        }
+
+    def _table_path(self, name):
+        ext = ".bin" if name in PRUNING_TABLE_NAMES else ".pkl"
+        return os.path.join(self.CACHE_DIR, name + ext)
+
     def _load_from_cache(self) -> bool:
-        if not os.path.exists(self.CACHE_FILE):
+        manifest_path = os.path.join(self.CACHE_DIR, MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
             return False
         try:
-            self._log(f"Chargement des tables depuis {os.path.basename(self.CACHE_FILE)}...")
-            t_start = time.time()
+            self._log(f"Chargement des tables depuis {os.path.basename(self.CACHE_DIR)}/...")
 
-            with open(self.CACHE_FILE, 'rb') as f:
-                data = pickle.load(f)
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
 
-            if data.get('version') != self.CACHE_VERSION:
+            if manifest.get('version') != self.CACHE_VERSION:
                 self._log("  Version du cache obsolète, régénération nécessaire...")
                 return False
 
-            self.twist_move = data['twist_move']
-            self.flip_move = data['flip_move']
-            self.FRtoBR_move = data['FRtoBR_move']
-            self.URFtoDLF_move = data['URFtoDLF_move']
-            self.URtoUL_move = data['URtoUL_move']
-            self.UBtoDF_move = data['UBtoDF_move']
-            self.URtoDF_move = data['URtoDF_move']
-            self.merge_URtoUL_UBtoDF = data['merge_URtoUL_UBtoDF']
-            self.slice_flip_prun = data['slice_flip_prun']
-            self.slice_twist_prun = data['slice_twist_prun']
-            self.slice_URFtoDLF_parity_prun = data['slice_URFtoDLF_parity_prun']
-            self.slice_URtoDF_parity_prun = data['slice_URtoDF_parity_prun']
-
-            elapsed = time.time() - t_start
-            self._log(f"Tables chargées en {elapsed:.2f} secondes")
+            entries = manifest.get('tables', {})
+            for name, (shape, dtype) in self._table_layouts().items():
+                entry = entries.get(name)
+                if entry is None or not os.path.exists(self._table_path(name)):
+                    self._log(f"  Table manquante: {name}, régénération nécessaire...")
+                    return False
+                if entry['shape'] != shape or entry['dtype'] != dtype:
+                    self._log(f"  Format de {name} différent, régénération nécessaire...")
+                    return False
+                if os.path.getsize(self._table_path(name)) != entry['bytes']:
+                    self._log(f"  Fichier {name} incomplet, régénération nécessaire...")
+                    return False
+
+            self._log("Tables disponibles (chargement à la demande)")
             return True
         except Exception as e:
             self._log(f"  Erreur lors du chargement du cache: {e}")
             self._log("  Régénération des tables...")
             return False
 
+    def prefetch(self):
+        """Charge toutes les tables tout de suite plutôt qu'au premier accès"""
+        for name in MOVE_TABLE_NAMES + PRUNING_TABLE_NAMES:
+            getattr(self, name)
+
+    def _load_table(self, name):
+        path = self._table_path(name)
+        if name in PRUNING_TABLE_NAMES:
+            # Lecture seule, partagée entre processus. La recherche visite
+            # ces tables au hasard : le noyau les précharge en arrière-plan
+            # plutôt que de prendre une faute de page à chaque nouvelle page.
+            with open(path, 'rb') as f:
+                table = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mmap, 'MADV_WILLNEED'):
+                table.madvise(mmap.MADV_WILLNEED)
+            return table
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
     def _save_to_cache(self):
         try:
-            self._log(f"Sauvegarde des tables dans {os.path.basename(self.CACHE_FILE)}...")
-
-            data = {
-                'version': self.CACHE_VERSION,
-                'twist_move': self.twist_move,
-                'flip_move': self.flip_move,
-                'FRtoBR_move': self.FRtoBR_move,
-                'URFtoDLF_move': self.URFtoDLF_move,
-                'URtoUL_move': self.URtoUL_move,
-                'UBtoDF_move': self.UBtoDF_move,
-                'URtoDF_move': self.URtoDF_move,
-                'merge_URtoUL_UBtoDF': self.merge_URtoUL_UBtoDF,
-                'slice_flip_prun': self.slice_flip_prun,
-                'slice_twist_prun': self.slice_twist_prun,
-                'slice_URFtoDLF_parity_prun': self.slice_URFtoDLF_parity_prun,
-                'slice_URtoDF_parity_prun': self.slice_URtoDF_parity_prun,
-            }
-
-            with open(self.CACHE_FILE, 'wb') as f:
-                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
-
-            size_mb = os.path.getsize(self.CACHE_FILE) / (1024 * 1024)
+            self._log(f"Sauvegarde des tables dans {os.path.basename(self.CACHE_DIR)}/...")
+            os.makedirs(self.CACHE_DIR, exist_ok=True)
+
+            layouts = self._table_layouts()
+            entries = {}
+            for name in MOVE_TABLE_NAMES + PRUNING_TABLE_NAMES:
+                path = self._table_path(name)
+                with open(path, 'wb') as f:
+                    if name in PRUNING_TABLE_NAMES:
+                        f.write(getattr(self, name))
+                    else:
+                        pickle.dump(getattr(self, name), f, protocol=pickle.HIGHEST_PROTOCOL)
+                shape, dtype = layouts[name]
+                entries[name] = {'shape': shape, 'dtype': dtype, 'bytes': os.path.getsize(path)}
+
+            # Le manifeste est écrit en dernier : un cache incomplet est ignoré.
+            with open(os.path.join(self.CACHE_DIR, MANIFEST_FILE), 'w') as f:
+                json.dump({'version': self.CACHE_VERSION, 'tables': entries}, f)
+
+            size_mb = sum(entry['bytes'] for entry in entries.values()) / (1024 * 1024)
             self._log(f"Tables sauvegardées ({size_mb:.1f} MB)")
         except Exception as e:
             self._log(f"  Avertissement: impossible de sauvegarder le cache: {e}")
@@ -167,232 +252,290 @@ class Tables:
         self._log("(Première exécution uniquement, ~2-5 minutes)")
         t_start = time.time()
 
-        self._log("  [1/12] twist_move...")
+        self._log("  [1/13] twist_move...")
         self.twist_move = self._gen_twist_move()
 
-        self._log("  [2/12] flip_move...")
+        self._log("  [2/13] flip_move...")
         self.flip_move = self._gen_flip_move()
 
-        self._log("  [3/12] FRtoBR_move...")
+        self._log("  [3/13] FRtoBR_move...")
         self.FRtoBR_move = self._gen_FRtoBR_move()
 
-        self._log("  [4/12] URFtoDLF_move...")
+        self._log("  [4/13] slice_move...")
+        self.slice_move = self._gen_slice_move()
+
+        self._log("  [5/13] URFtoDLF_move...")
         self.URFtoDLF_move = self._gen_URFtoDLF_move()
 
-        self._log("  [5/12] URtoUL_move...")
+        self._log("  [6/13] URtoUL_move...")
         self.URtoUL_move = self._gen_URtoUL_move()
 
-        self._log("  [6/12] UBtoDF_move...")
+        self._log("  [7/13] UBtoDF_move...")
         self.UBtoDF_move = self._gen_UBtoDF_move()
 
-        self._log("  [7/12] URtoDF_move...")
+        self._log("  [8/13] URtoDF_move...")
         self.URtoDF_move = self._gen_URtoDF_move()
 
-        self._log("  [8/12] merge_URtoUL_UBtoDF...")
-        self.merge_URtoUL_UBtoDF = self._gen_merge_table()
+        self._log("  [9/13] merge_URtoUL_UBtoDF_flat...")
+        self.merge_URtoUL_UBtoDF_flat = self._gen_merge_table()
 
-        self._log("  [9/12] slice_flip_prun...")
+        self._log("  [10/13] slice_flip_prun...")
         self.slice_flip_prun = self._gen_slice_flip_prun()
 
-        self._log("  [10/12] slice_twist_prun...")
+        self._log("  [11/13] slice_twist_prun...")
         self.slice_twist_prun = self._gen_slice_twist_prun()
 
-        self._log("  [11/12] slice_URFtoDLF_parity_prun...")
+        self._log("  [12/13] slice_URFtoDLF_parity_prun...")
         self.slice_URFtoDLF_parity_prun = self._gen_slice_URFtoDLF_parity_prun()
 
-        self._log("  [12/12] slice_URtoDF_parity_prun...")
+        self._log("  [13/13] slice_URtoDF_parity_prun...")
         self.slice_URtoDF_parity_prun = self._gen_slice_URtoDF_parity_prun()
 
         elapsed = time.time() - t_start
         self._log(f"Tables générées en {elapsed:.1f} secondes")
 
+    def _move_powers(self):
+        """Les 18 mouvements (U, U2, U', R, ...) composés une fois: un multiply par entrée de table"""
+        moves = []
+        for j in range(6):
+            c = self._cube_class()
+            for _ in range(3):
+                c.multiply(self._move_cube[j])
+                moves.append(self._cube_class(c.cp, c.co, c.ep, c.eo))
+        return moves
+
     def _gen_twist_move(self):
         cfg = self._cfg
+        moves = self._move_powers()
         table = [[0] * cfg.N_MOVE for _ in range(cfg.N_TWIST)]
         a = self._cube_class()
         for i in range(cfg.N_TWIST):
             a.set_twist(i)
-            for j in range(6):
-                for k in range(3):
-                    a.corner_multiply(self._move_cube[j])
-                    table[i][3 * j + k] = a.get_twist()
-                a.corner_multiply(self._move_cube[j])
+            cp, co = a.cp, a.co
+            row = table[i]
+            for mv in range(cfg.N_MOVE):
+                a.cp, a.co = cp, co
+                a.corner_multiply(moves[mv])
+                row[mv] = a.get_twist()
         return table
 
     def _gen_flip_move(self):
         cfg = self._cfg
+        moves = self._move_powers()
         table = [[0] * cfg.N_MOVE for _ in range(cfg.N_FLIP)]
         a = self._cube_class()
         for i in range(cfg.N_FLIP):
             a.set_flip(i)
-            for j in range(6):
-                for k in range(3):
-                    a.edge_multiply(self._move_cube[j])
-                    table[i][3 * j + k] = a.get_flip()
-                a.edge_multiply(self._move_cube[j])
+            ep, eo = a.ep, a.eo
+            row = table[i]
+            for mv in range(cfg.N_MOVE):
+                a.ep, a.eo = ep, eo
+                a.edge_multiply(moves[mv])
+                row[mv] = a.get_flip()
         return table
 
     def _gen_FRtoBR_move(self):
         cfg = self._cfg
+        moves = self._move_powers()
         table = [[0] * cfg.N_MOVE for _ in range(cfg.N_FRtoBR)]
         a = self._cube_class()
         for i in range(cfg.N_FRtoBR):
             a.set_FRtoBR(i)
-            for j in range(6):
-                for k in range(3):
-                    a.edge_multiply(self._move_cube[j])
-                    table[i][3 * j + k] = a.get_FRtoBR()
-                a.edge_multiply(self._move_cube[j])
+            ep, eo = a.ep, a.eo
+            row = table[i]
+            for mv in range(cfg.N_MOVE):
+                a.ep, a.eo = ep, eo
+                a.edge_multiply(moves[mv])
+                row[mv] = a.get_FRtoBR()
         return table
 
+    def _gen_slice_move(self):
+        """Mouvements de la coordonnée slice seule (phase 1): FRtoBR_move[24 * s][mv] // 24"""
+        cfg = self._cfg
+        return [[self.FRtoBR_move[24 * s][mv] // 24 for mv in range(cfg.N_MOVE)]
+                for s in range(cfg.N_SLICE1)]
+
     def _gen_URFtoDLF_move(self):
         cfg = self._cfg
+        moves = self._move_powers()
         table = [[0] * cfg.N_MOVE for _ in range(cfg.N_URFtoDLF)]
         a = self._cube_class()
         for i in range(cfg.N_URFtoDLF):
             a.set_URFtoDLF(i)
-            for j in range(6):
-                for k in range(3):
-                    a.corner_multiply(self._move_cube[j])
-                    table[i][3 * j + k] = a.get_URFtoDLF()
-                a.corner_multiply(self._move_cube[j])
+            cp, co = a.cp, a.co
+            row = table[i]
+            for mv in range(cfg.N_MOVE):
+                a.cp, a.co = cp, co
+                a.corner_multiply(moves[mv])
+                row[mv] = a.get_URFtoDLF()
         return table
 
     def _gen_URtoUL_move(self):
         cfg = self._cfg
+        moves = self._move_powers()
         table = [[0] * cfg.N_MOVE for _ in range(cfg.N_URtoUL)]
         a = self._cube_class()
         for i in range(cfg.N_URtoUL):
             a.set_URtoUL(i)
-            for j in range(6):
-                for k in range(3):
-                    a.edge_multiply(self._move_cube[j])
-                    table[i][3 * j + k] = a.get_URtoUL()
-                a.edge_multiply(self._move_cube[j])
+            ep, eo = a.ep, a.eo
+            row = table[i]
+            for mv in range(cfg.N_MOVE):
+                a.ep, a.eo = ep, eo
+                a.edge_multiply(moves[mv])
+                row[mv] = a.get_URtoUL()
         return table
 
     def _gen_UBtoDF_move(self):
         cfg = self._cfg
+        moves = self._move_powers()
         table = [[0] * cfg.N_MOVE for _ in range(cfg.N_UBtoDF)]
         a = self._cube_class()
         for i in range(cfg.N_UBtoDF):
             a.set_UBtoDF(i)
-            for j in range(6):
-                for k in range(3):
-                    a.edge_multiply(self._move_cube[j])
-                    table[i][3 * j + k] = a.get_UBtoDF()
-                a.edge_multiply(self._move_cube[j])
+            ep, eo = a.ep, a.eo
+            row = table[i]
+            for mv in range(cfg.N_MOVE):
+                a.ep, a.eo = ep, eo
+                a.edge_multiply(moves[mv])
+                row[mv] = a.get_UBtoDF()
         return table
 
     def _gen_URtoDF_move(self):
         cfg = self._cfg
+        moves = self._move_powers()
         table = [[0] * cfg.N_MOVE for _ in range(cfg.N_URtoDF)]
         a = self._cube_class()
         for i in range(cfg.N_URtoDF):
             a.set_URtoDF(i)
-            for j in range(6):
-                for k in range(3):
-                    a.edge_multiply(self._move_cube[j])
-                    table[i][3 * j + k] = a.get_URtoDF()
-                a.edge_multiply(self._move_cube[j])
+            ep, eo = a.ep, a.eo
+            row = table[i]
+            for mv in range(cfg.N_MOVE):
+                a.ep, a.eo = ep, eo
+                a.edge_multiply(moves[mv])
+                row[mv] = a.get_URtoDF()
         return table
 
     def _gen_merge_table(self):
+        """Table plate 336x336 (int16) indexée par uRtoUL * 336 + uBtoDF, -1 si incompatible"""
         cfg = self._cfg
-        table = [[0] * 336 for _ in range(336)]
+        table = array('h', [-1]) * (336 * 336)
+
+        def placed(ep):
+            """Positions (parmi les 8 premières) occupées, en masque de bits"""
+            return sum(1 << i for i in range(8) if ep[i] != cfg.BR)
+
+        # Arêtes et masque de chaque uBtoDF, calculés une fois pour les 336 uRtoUL
+        b = self._cube_class()
+        ub_edges = []
+        for uBtoDF in range(336):
+            b.set_UBtoDF(uBtoDF)
+            ub_edges.append((b.ep, placed(b.ep)))
+
+        a = self._cube_class()
         for uRtoUL in range(336):
-            for uBtoDF in range(336):
-                a = self._cube_class()
-                b = self._cube_class()
-                a.set_URtoUL(uRtoUL)
-                b.set_UBtoDF(uBtoDF)
-
-                for i in range(8):
-                    if a.ep[i] != cfg.BR:
-                        if b.ep[i] != cfg.BR:
-                            table[uRtoUL][uBtoDF] = -1
-                            break
-                        b.ep[i] = a.ep[i]
-                else:
-                    table[uRtoUL][uBtoDF] = b.get_URtoDF()
+            a.set_URtoUL(uRtoUL)
+            a_mask = placed(a.ep)
+            a_edges = [(i, a.ep[i]) for i in range(8) if a_mask >> i & 1]
+            row = uRtoUL * 336
+            for uBtoDF, (b_ep, b_mask) in enumerate(ub_edges):
+                # Compatibles si aucune position n'est occupée des deux côtés
+                if a_mask & b_mask:
+                    continue
+                b.ep = list(b_ep)
+                for i, e in a_edges:
+                    b.ep[i] = e
+                table[row + uBtoDF] = b.get_URtoDF()
         return table
 
     def _gen_slice_flip_prun(self):
         cfg = self._cfg
-        size = cfg.N_SLICE1 * cfg.N_FLIP
-        table = bytearray([0xff] * ((size >> 1) + 1))
+        n_slice = cfg.N_SLICE1
+        size = n_slice * cfg.N_FLIP
+        table = bytearray(b'\xff') * ((size >> 1) + 1)
         set_pruning(table, 0, 0)
+        slice_move = self.slice_move
+        flip_move = self.flip_move
 
         current = [0]
         depth = 0
 
         while current:
             next_level = []
+            append = next_level.append
+            # Un nibble libre vaut 0x0f: un XOR avec 0x0f ^ (depth + 1) y écrit depth + 1
+            mark = 0x0f ^ (depth + 1)
             for idx in current:
-                flip_idx = idx // cfg.N_SLICE1
-                slice_idx = idx % cfg.N_SLICE1
-                for mv in range(18):
-                    new_slice = self.FRtoBR_move[slice_idx * 24][mv] // 24
-                    new_flip = self.flip_move[flip_idx][mv]
-                    new_idx = cfg.N_SLICE1 * new_flip + new_slice
-                    if get_pruning(table, new_idx) == 0x0f:
-                        set_pruning(table, new_idx, depth + 1)
-                        next_level.append(new_idx)
+                flip_idx, slice_idx = divmod(idx, n_slice)
+                for new_slice, new_flip in zip(slice_move[slice_idx], flip_move[flip_idx]):
+                    new_idx = n_slice * new_flip + new_slice
+                    shift = (new_idx & 1) << 2
+                    if (table[new_idx >> 1] >> shift) & 0x0f == 0x0f:
+                        table[new_idx >> 1] ^= mark << shift
+                        append(new_idx)
             current = next_level
             depth += 1
         return table
 
     def _gen_slice_twist_prun(self):
         cfg = self._cfg
-        size = cfg.N_SLICE1 * cfg.N_TWIST
-        table = bytearray([0xff] * ((size >> 1) + 1))
+        n_slice = cfg.N_SLICE1
+        size = n_slice * cfg.N_TWIST
+        table = bytearray(b'\xff') * ((size >> 1) + 1)
         set_pruning(table, 0, 0)
+        slice_move = self.slice_move
+        twist_move = self.twist_move
 
         current = [0]
         depth = 0
 
         while current:
             next_level = []
+            append = next_level.append
+            # Un nibble libre vaut 0x0f: un XOR avec 0x0f ^ (depth + 1) y écrit depth + 1
+            mark = 0x0f ^ (depth + 1)
             for idx in current:
-                twist_idx = idx // cfg.N_SLICE1
-                slice_idx = idx % cfg.N_SLICE1
-                for mv in range(18):
-                    new_slice = self.FRtoBR_move[slice_idx * 24][mv] // 24
-                    new_twist = self.twist_move[twist_idx][mv]
-                    new_idx = cfg.N_SLICE1 * new_twist + new_slice
-                    if get_pruning(table, new_idx) == 0x0f:
-                        set_pruning(table, new_idx, depth + 1)
-                        next_level.append(new_idx)
+                twist_idx, slice_idx = divmod(idx, n_slice)
+                for new_slice, new_twist in zip(slice_move[slice_idx], twist_move[twist_idx]):
+                    new_idx = n_slice * new_twist + new_slice
+                    shift = (new_idx & 1) << 2
+                    if (table[new_idx >> 1] >> shift) & 0x0f == 0x0f:
+                        table[new_idx >> 1] ^= mark << shift
+                        append(new_idx)
             current = next_level
             depth += 1
         return table
 
     def _gen_slice_URFtoDLF_parity_prun(self):
         cfg = self._cfg
-        size = cfg.N_SLICE2 * cfg.N_URFtoDLF * cfg.N_PARITY
-        table = bytearray([0xff] * ((size >> 1) + 1))
+        n_slice = cfg.N_SLICE2
+        size = n_slice * cfg.N_URFtoDLF * cfg.N_PARITY
+        table = bytearray(b'\xff') * ((size >> 1) + 1)
         set_pruning(table, 0, 0)
 
+        # Lignes des tables de mouvements réduites aux 10 mouvements de phase 2.
+        # Ces mouvements laissent les arêtes du slice dans le slice: FRtoBR
+        # reste < 24, inutile de réduire modulo 24.
         phase2_moves = (0, 1, 2, 4, 7, 9, 10, 11, 13, 16)
+        slice_rows = [[row[mv] for mv in phase2_moves] for row in self.FRtoBR_move[:n_slice]]
+        URFtoDLF_rows = [[row[mv] for mv in phase2_moves] for row in self.URFtoDLF_move]
+        parity_rows = [[row[mv] for mv in phase2_moves] for row in self._parity_move]
 
         current = [0]
         depth = 0
 
         while current:
             next_level = []
+            append = next_level.append
+            mark = 0x0f ^ (depth + 1)
             for idx in current:
-                parity = idx % 2
-                URFtoDLF = (idx >> 1) // cfg.N_SLICE2
-                slice_idx = (idx >> 1) % cfg.N_SLICE2
-
-                for mv in phase2_moves:
-                    new_slice = self.FRtoBR_move[slice_idx][mv] % 24
-                    new_URFtoDLF = self.URFtoDLF_move[URFtoDLF][mv]
-                    new_parity = self._parity_move[parity][mv]
-                    new_idx = (cfg.N_SLICE2 * new_URFtoDLF + new_slice) * 2 + new_parity
-                    if new_idx < size and get_pruning(table, new_idx) == 0x0f:
-                        set_pruning(table, new_idx, depth + 1)
-                        next_level.append(new_idx)
+                URFtoDLF, slice_idx = divmod(idx >> 1, n_slice)
+                for new_slice, new_URFtoDLF, new_parity in zip(
+                        slice_rows[slice_idx], URFtoDLF_rows[URFtoDLF], parity_rows[idx & 1]):
+                    new_idx = (n_slice * new_URFtoDLF + new_slice) * 2 + new_parity
+                    shift = (new_idx & 1) << 2
+                    if new_idx < size and (table[new_idx >> 1] >> shift) & 0x0f == 0x0f:
+                        table[new_idx >> 1] ^= mark << shift
+                        append(new_idx)
 
             current = next_level
             depth += 1
@@ -400,30 +543,35 @@ class Tables:
 
     def _gen_slice_URtoDF_parity_prun(self):
         cfg = self._cfg
-        size = cfg.N_SLICE2 * cfg.N_URtoDF * cfg.N_PARITY
-        table = bytearray([0xff] * ((size >> 1) + 1))
+        n_slice = cfg.N_SLICE2
+        size = n_slice * cfg.N_URtoDF * cfg.N_PARITY
+        table = bytearray(b'\xff') * ((size >> 1) + 1)
         set_pruning(table, 0, 0)
 
+        # Lignes des tables de mouvements réduites aux 10 mouvements de phase 2.
+        # Ces mouvements laissent les arêtes du slice dans le slice: FRtoBR
+        # reste < 24, inutile de réduire modulo 24.
         phase2_moves = (0, 1, 2, 4, 7, 9, 10, 11, 13, 16)
+        slice_rows = [[row[mv] for mv in phase2_moves] for row in self.FRtoBR_move[:n_slice]]
+        URtoDF_rows = [[row[mv] for mv in phase2_moves] for row in self.URtoDF_move]
+        parity_rows = [[row[mv] for mv in phase2_moves] for row in self._parity_move]
 
         current = [0]
         depth = 0
 
         while current:
             next_level = []
+            append = next_level.append
+            mark = 0x0f ^ (depth + 1)
             for idx in current:
-                parity = idx % 2
-                URtoDF = (idx >> 1) // cfg.N_SLICE2
-                slice_idx = (idx >> 1) % cfg.N_SLICE2
-
-                for mv in phase2_moves:
-                    new_slice = self.FRtoBR_move[slice_idx][mv] % 24
-                    new_URtoDF = self.URtoDF_move[URtoDF][mv]
-                    new_parity = self._parity_move[parity][mv]
-                    new_idx = (cfg.N_SLICE2 * new_URtoDF + new_slice) * 2 + new_parity
-                    if new_idx < size and get_pruning(table, new_idx) == 0x0f:
-                        set_pruning(table, new_idx, depth + 1)
-                        next_level.append(new_idx)
+                URtoDF, slice_idx = divmod(idx >> 1, n_slice)
+                for new_slice, new_URtoDF, new_parity in zip(
+                        slice_rows[slice_idx], URtoDF_rows[URtoDF], parity_rows[idx & 1]):
+                    new_idx = (n_slice * new_URtoDF + new_slice) * 2 + new_parity
+                    shift = (new_idx & 1) << 2
+                    if new_idx < size and (table[new_idx >> 1] >> shift) & 0x0f == 0x0f:
+                        table[new_idx >> 1] ^= mark << shift
+                        append(new_idx)
 
             current = next_level
             depth += 1
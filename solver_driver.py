@@ -0,0 +1,95 @@
+"""Pilote commun: applique un mélange, lance un solveur et vérifie la solution
+
+Utilisé par main.py et test_kociemba.py pour que le chemin
+mélange -> cubestring -> résolution -> vérification n'existe qu'une fois.
+"""
+
+import time
+from solver_kociemba import CubieCube, MOVE_CUBE, solve
+from solver_kociemba_fast import solve_fast
+
+MOVE_NAMES = ["U", "R", "F", "D", "L", "B"]
+
+# Cube de chaque mouvement (U, U2, U', R, ...) composé une fois pour toutes:
+# un seul multiply par mouvement au lieu de 1 à 3
+MOVE_PERMS = {}
+for _face_idx, _face in enumerate(MOVE_NAMES):
+    _cc = CubieCube()
+    for _suffix in ("", "2", "'"):
+        _cc.multiply(MOVE_CUBE[_face_idx])
+        MOVE_PERMS[_face + _suffix] = CubieCube(_cc.cp, _cc.co, _cc.ep, _cc.eo)
+
+
+def apply_moves(scramble: str, cc: CubieCube = None) -> CubieCube:
+    """Applique une séquence de mouvements à un cube (résolu par défaut)"""
+    if cc is None:
+        cc = CubieCube()
+
+    for move in scramble.split():
+        move_cube = MOVE_PERMS.get(move)
+        if move_cube is None:
+            print(f"Mouvement inconnu: {move}")
+            continue
+        cc.multiply(move_cube)
+
+    return cc
+
+
+def run_solver(shuffle: str, *, fast=False, max_depth, timeout,
+               timeout_per_depth=None, verify=False) -> dict:
+    """
+    Mélange un cube résolu avec shuffle puis le résout.
+
+    Args:
+        shuffle: Séquence de mouvements (ex: "R F B2 F'")
+        fast: Utiliser solve_fast (première solution) au lieu de solve
+        max_depth: Profondeur maximale passée au solveur
+        timeout: Temps limite en secondes
+        timeout_per_depth: Temps limite par profondeur (solve_fast uniquement,
+            défaut du solveur si None)
+        verify: Rejouer la solution sur le cube mélangé
+
+    Returns:
+        Dict avec success, solution, moves, time (ou error)
+    """
+    cc = apply_moves(shuffle)
+    fc = cc.to_facecube()
+    cubestring = fc.to_string()
+    print(f"Cubestring: {cubestring}")
+
+    # Résoudre
+    start = time.time()
+    try:
+        if fast:
+            kwargs = {} if timeout_per_depth is None else {"timeout_per_depth": timeout_per_depth}
+            solution = solve_fast(cubestring, max_depth=max_depth, timeout=timeout, **kwargs)
+        else:
+            solution = solve(cubestring, max_depth=max_depth, timeout=timeout)
+        elapsed = time.time() - start
+
+        if solution.startswith("Error"):
+            print(f"❌ ERREUR: {solution}")
+            return {"success": False, "error": solution, "time": elapsed}
+
+        sol_moves = len(solution.split()) if solution else 0
+        print(f"✅ Solution: {solution}")
+        print(f"   Longueur: {sol_moves} mouvements")
+        print(f"   Temps: {elapsed:.3f}s")
+
+        # Vérifier la solution (sur demande)
+        if verify:
+            # Appliquer la solution au cube scramblé (cc n'est plus utilisé)
+            verify_cc = apply_moves(solution, cc)
+
+            if verify_cc.is_solved():
+                print(f"   ✓ Solution vérifiée correcte!")
+            else:
+                verify_str = verify_cc.to_facecube().to_string()
+                print(f"   ⚠ Solution non vérifiée (résultat: {verify_str})")
+
+        return {"success": True, "solution": solution, "moves": sol_moves, "time": elapsed}
+
+    except Exception as e:
+        elapsed = time.time() - start
+        print(f"❌ EXCEPTION: {e}")
+        return {"success": False, "error": str(e), "time": elapsed}
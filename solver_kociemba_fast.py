@@ -18,6 +18,8 @@ UTILISATION:
 """
 
 import time
+from functools import lru_cache
+from math import factorial
 
 from kociemba_tables import Tables, KociembaTablesConfig, get_pruning
 
@@ -28,6 +30,10 @@ from kociemba_tables import Tables, KociembaTablesConfig, get_pruning
 U, R, F, D, L, B = 0, 1, 2, 3, 4, 5
 COLORS = {'U': U, 'R': R, 'F': F, 'D': D, 'L': L, 'B': B}
 COLOR_NAMES = ['U', 'R', 'F', 'D', 'L', 'B']
+# Table de traduction 0..5 -> 'URFDLB' pour convertir les 54 facelets d'un coup
+COLOR_TRANS = bytes.maketrans(bytes(range(6)), b'URFDLB')
+FACELET_TRANS = bytes(COLORS.get(chr(i), U) for i in range(256))
+COLOR_DELETE = str.maketrans('', '', 'URFDLB')
 
 URF, UFL, ULB, UBR, DFR, DLF, DBL, DRB = range(8)
 UR, UF, UL, UB, DR, DF, DL, DB, FR, FL, BL, BR = range(12)
@@ -59,6 +65,22 @@ EDGE_COLOR = (
     (D, L), (D, B), (F, R), (F, L), (B, L), (B, R),
 )
 
+CORNER_FACELET_ORI = tuple(
+    tuple(tuple(fl[(n + ori) % 3] for n in range(3)) for ori in range(3))
+    for fl in CORNER_FACELET
+)
+EDGE_FACELET_ORI = tuple(
+    tuple(tuple(fl[(n + ori) % 2] for n in range(2)) for ori in range(2))
+    for fl in EDGE_FACELET
+)
+CORNER_LOOKUP = {(col[1], col[2]): j for j, col in enumerate(CORNER_COLOR)}
+EDGE_LOOKUP = {}
+for _j, (_c0, _c1) in enumerate(EDGE_COLOR):
+    EDGE_LOOKUP[(_c0, _c1)] = (_j, 0)
+    EDGE_LOOKUP[(_c1, _c0)] = (_j, 1)
+
+MOD3 = (0, 1, 2, 0, 1)
+
 N_TWIST = 2187
 N_FLIP = 2048
 N_SLICE1 = 495
@@ -69,8 +91,20 @@ N_FRtoBR = 11880
 N_URtoUL = 1320
 N_UBtoDF = 1320
 N_URtoDF = 20160
+N_MERGE = 336
 N_MOVE = 18
 
+MV_TABLE = (
+    (0, 0, 1, 2),
+    (0, 3, 4, 5),
+    (0, 6, 7, 8),
+    (0, 9, 10, 11),
+    (0, 12, 13, 14),
+    (0, 15, 16, 17),
+)
+
+AXIS_OK = tuple(tuple(prev != ax and prev - 3 != ax for ax in range(6)) for prev in range(6))
+
 PARITY_MOVE = (
     (1, 0, 1, 1, 0, 1, 1, 0, 1, 1, 0, 1, 1, 0, 1, 1, 0, 1),
     (0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0),
@@ -105,17 +139,46 @@ def Cnk(n, k):
         s = s * (n - i) // (i + 1)
     return s
 
-def rotate_left(arr, l, r):
-    temp = arr[l]
-    for i in range(l, r):
-        arr[i] = arr[i + 1]
-    arr[r] = temp
+# Triangle de Pascal précalculé: CNK[n][k] == Cnk(n, k) pour n, k <= 12
+CNK = tuple(tuple(Cnk(n, k) for k in range(13)) for n in range(13))
 
 def rotate_right(arr, l, r):
-    temp = arr[r]
-    for i in range(r, l, -1):
-        arr[i] = arr[i - 1]
-    arr[l] = temp
+    arr.insert(l, arr.pop(r))
+
+def permutation_parity(perm):
+    p = list(perm)
+    parity = 0
+    for i in range(len(p)):
+        while p[i] != i:
+            j = p[i]
+            p[i], p[j] = p[j], j
+            parity ^= 1
+    return parity
+
+def unrank_table(items):
+    table = []
+    for b in range(factorial(len(items))):
+        perm = list(items)
+        for j in range(1, len(items)):
+            k = b % (j + 1)
+            b //= (j + 1)
+            while k > 0:
+                rotate_right(perm, 0, j)
+                k -= 1
+        table.append(tuple(perm))
+    return tuple(table)
+
+# Permutations des set_* indexées par b (au lieu du décodage factoriel à chaque appel)
+PERM_URFtoDLF = unrank_table((URF, UFL, ULB, UBR, DFR, DLF))
+PERM_FRtoBR = unrank_table((FR, FL, BL, BR))
+PERM_URtoUL = unrank_table((UR, UF, UL))
+PERM_UBtoDF = unrank_table((UB, DR, DF))
+PERM_URtoDF = unrank_table((UR, UF, UL, UB, DR, DF))
+RANK_URFtoDLF = {perm: b for b, perm in enumerate(PERM_URFtoDLF)}
+RANK_FRtoBR = {perm: b for b, perm in enumerate(PERM_FRtoBR)}
+RANK_URtoUL = {perm: b for b, perm in enumerate(PERM_URtoUL)}
+RANK_UBtoDF = {perm: b for b, perm in enumerate(PERM_UBtoDF)}
+RANK_URtoDF = {perm: b for b, perm in enumerate(PERM_URtoDF)}
 
 # =============================================================================
 # CUBIE CUBE
@@ -131,253 +194,214 @@ class CubieCube:
         self.eo = list(eo) if eo else [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
     
     def corner_multiply(self, b):
-        cp_new = [self.cp[b.cp[i]] for i in range(8)]
-        co_new = [(self.co[b.cp[i]] + b.co[i]) % 3 for i in range(8)]
-        self.cp = cp_new
-        self.co = co_new
+        cp = self.cp
+        co = self.co
+        self.cp = [cp[j] for j in b.cp]
+        self.co = [MOD3[co[j] + o] for j, o in zip(b.cp, b.co)]
     
     def edge_multiply(self, b):
-        ep_new = [self.ep[b.ep[i]] for i in range(12)]
-        eo_new = [(self.eo[b.ep[i]] + b.eo[i]) % 2 for i in range(12)]
-        self.ep = ep_new
-        self.eo = eo_new
+        ep = self.ep
+        eo = self.eo
+        self.ep = [ep[j] for j in b.ep]
+        self.eo = [eo[j] ^ o for j, o in zip(b.ep, b.eo)]
     
     def multiply(self, b):
-        self.corner_multiply(b)
-        self.edge_multiply(b)
+        cp = self.cp
+        co = self.co
+        ep = self.ep
+        eo = self.eo
+        self.cp = [cp[j] for j in b.cp]
+        self.co = [MOD3[co[j] + o] for j, o in zip(b.cp, b.co)]
+        self.ep = [ep[j] for j in b.ep]
+        self.eo = [eo[j] ^ o for j, o in zip(b.ep, b.eo)]
+    
+    def is_solved(self):
+        return (self.cp == [URF, UFL, ULB, UBR, DFR, DLF, DBL, DRB] and
+                self.ep == [UR, UF, UL, UB, DR, DF, DL, DB, FR, FL, BL, BR] and
+                not any(self.co) and not any(self.eo))
     
     def get_twist(self):
-        ret = 0
-        for i in range(7):
-            ret = 3 * ret + self.co[i]
-        return ret
+        # Base 3 déroulée (le 8e coin se déduit des 7 autres)
+        co = self.co
+        return (((((co[0] * 3 + co[1]) * 3 + co[2]) * 3 + co[3]) * 3 + co[4]) * 3 + co[5]) * 3 + co[6]
     
     def set_twist(self, twist):
-        parity = 0
-        for i in range(6, -1, -1):
-            self.co[i] = twist % 3
-            parity += self.co[i]
-            twist //= 3
-        self.co[7] = (3 - parity % 3) % 3
+        twist, c6 = divmod(twist, 3)
+        twist, c5 = divmod(twist, 3)
+        twist, c4 = divmod(twist, 3)
+        twist, c3 = divmod(twist, 3)
+        twist, c2 = divmod(twist, 3)
+        c0, c1 = divmod(twist % 9, 3)
+        self.co = [c0, c1, c2, c3, c4, c5, c6, -(c0 + c1 + c2 + c3 + c4 + c5 + c6) % 3]
     
     def get_flip(self):
-        ret = 0
-        for i in range(11):
-            ret = 2 * ret + self.eo[i]
-        return ret
+        # Les 11 premiers bits d'orientation, eo[0] en poids fort
+        eo = self.eo
+        return (eo[0] << 10 | eo[1] << 9 | eo[2] << 8 | eo[3] << 7 | eo[4] << 6 | eo[5] << 5 |
+                eo[6] << 4 | eo[7] << 3 | eo[8] << 2 | eo[9] << 1 | eo[10])
     
     def set_flip(self, flip):
-        parity = 0
-        for i in range(10, -1, -1):
-            self.eo[i] = flip % 2
-            parity += self.eo[i]
-            flip //= 2
-        self.eo[11] = (2 - parity % 2) % 2
+        self.eo = [flip >> 10 & 1, flip >> 9 & 1, flip >> 8 & 1, flip >> 7 & 1,
+                   flip >> 6 & 1, flip >> 5 & 1, flip >> 4 & 1, flip >> 3 & 1,
+                   flip >> 2 & 1, flip >> 1 & 1, flip & 1, bin(flip & 0x7ff).count("1") & 1]
     
     def get_FRtoBR(self):
         a, x = 0, 0
         edge4 = [0, 0, 0, 0]
         for j in range(11, -1, -1):
             if FR <= self.ep[j] <= BR:
-                a += Cnk(11 - j, x + 1)
+                a += CNK[11 - j][x + 1]
                 edge4[3 - x] = self.ep[j]
                 x += 1
-        b = 0
-        for j in range(3, 0, -1):
-            k = 0
-            while edge4[j] != j + 8:
-                rotate_left(edge4, 0, j)
-                k += 1
-            b = (j + 1) * b + k
+        b = RANK_FRtoBR[tuple(edge4)]
         return 24 * a + b
     
     def set_FRtoBR(self, idx):
-        sliceEdge = [FR, FL, BL, BR]
-        otherEdge = [UR, UF, UL, UB, DR, DF, DL, DB]
-        b = idx % 24
+        sliceEdge = PERM_FRtoBR[idx % 24]
         a = idx // 24
-        for i in range(12):
-            self.ep[i] = DB
-        for j in range(1, 4):
-            k = b % (j + 1)
-            b //= (j + 1)
-            while k > 0:
-                k -= 1
-                rotate_right(sliceEdge, 0, j)
+        ep = [DB] * 12
         x = 3
         for j in range(12):
-            if a - Cnk(11 - j, x + 1) >= 0:
-                self.ep[j] = sliceEdge[3 - x]
-                a -= Cnk(11 - j, x + 1)
+            if a >= CNK[11 - j][x + 1]:
+                ep[j] = sliceEdge[3 - x]
+                a -= CNK[11 - j][x + 1]
                 x -= 1
-        x = 0
-        for j in range(12):
-            if self.ep[j] == DB:
-                self.ep[j] = otherEdge[x]
-                x += 1
+                if x < 0:
+                    break
+        other = iter((UR, UF, UL, UB, DR, DF, DL, DB))
+        self.ep = [e if e != DB else next(other) for e in ep]
     
     def corner_parity(self):
-        s = 0
-        for i in range(7, 0, -1):
-            for j in range(i - 1, -1, -1):
-                if self.cp[j] > self.cp[i]:
-                    s += 1
-        return s % 2
+        return permutation_parity(self.cp)
     
     def get_URFtoDLF(self):
-        a, b, x = 0, 0, 0
+        a, x = 0, 0
         corner6 = [0] * 6
         for j in range(8):
             if self.cp[j] <= DLF:
-                a += Cnk(j, x + 1)
+                a += CNK[j][x + 1]
                 corner6[x] = self.cp[j]
                 x += 1
-        for j in range(5, 0, -1):
-            k = 0
-            while corner6[j] != j:
-                rotate_left(corner6, 0, j)
-                k += 1
-            b = (j + 1) * b + k
+        b = RANK_URFtoDLF[tuple(corner6)]
         return 720 * a + b
     
     def set_URFtoDLF(self, idx):
-        corner6 = [URF, UFL, ULB, UBR, DFR, DLF]
-        other = [DBL, DRB]
-        b = idx % 720
+        corner6 = PERM_URFtoDLF[idx % 720]
         a = idx // 720
-        for i in range(8):
-            self.cp[i] = DRB
-        for j in range(1, 6):
-            k = b % (j + 1)
-            b //= (j + 1)
-            while k > 0:
-                rotate_right(corner6, 0, j)
-                k -= 1
+        cp = [DRB] * 8
         x = 5
         for j in range(7, -1, -1):
-            if a - Cnk(j, x + 1) >= 0:
-                self.cp[j] = corner6[x]
-                a -= Cnk(j, x + 1)
+            if a >= CNK[j][x + 1]:
+                cp[j] = corner6[x]
+                a -= CNK[j][x + 1]
                 x -= 1
-        x = 0
-        for j in range(8):
-            if self.cp[j] == DRB:
-                self.cp[j] = other[x]
-                x += 1
+                if x < 0:
+                    break
+        other = iter((DBL, DRB))
+        self.cp = [c if c != DRB else next(other) for c in cp]
     
     def get_URtoUL(self):
-        a, b, x = 0, 0, 0
+        a, x = 0, 0
         edge3 = [0, 0, 0]
         for j in range(12):
             if self.ep[j] <= UL:
-                a += Cnk(j, x + 1)
+                a += CNK[j][x + 1]
                 edge3[x] = self.ep[j]
                 x += 1
-        for j in range(2, 0, -1):
-            k = 0
-            while edge3[j] != j:
-                rotate_left(edge3, 0, j)
-                k += 1
-            b = (j + 1) * b + k
+        b = RANK_URtoUL[tuple(edge3)]
         return 6 * a + b
     
     def set_URtoUL(self, idx):
-        edge3 = [UR, UF, UL]
-        b = idx % 6
+        edge3 = PERM_URtoUL[idx % 6]
         a = idx // 6
-        for i in range(12):
-            self.ep[i] = BR
-        for j in range(1, 3):
-            k = b % (j + 1)
-            b //= (j + 1)
-            while k > 0:
-                rotate_right(edge3, 0, j)
-                k -= 1
+        ep = [BR] * 12
         x = 2
         for j in range(11, -1, -1):
-            if a - Cnk(j, x + 1) >= 0:
-                self.ep[j] = edge3[x]
-                a -= Cnk(j, x + 1)
+            if a >= CNK[j][x + 1]:
+                ep[j] = edge3[x]
+                a -= CNK[j][x + 1]
                 x -= 1
+                if x < 0:
+                    break
+        self.ep = ep
     
     def get_UBtoDF(self):
-        a, b, x = 0, 0, 0
+        a, x = 0, 0
         edge3 = [0, 0, 0]
         for j in range(12):
             if UB <= self.ep[j] <= DF:
-                a += Cnk(j, x + 1)
+                a += CNK[j][x + 1]
                 edge3[x] = self.ep[j]
                 x += 1
-        for j in range(2, 0, -1):
-            k = 0
-            while edge3[j] != j + UB:
-                rotate_left(edge3, 0, j)
-                k += 1
-            b = (j + 1) * b + k
+        b = RANK_UBtoDF[tuple(edge3)]
         return 6 * a + b
     
     def set_UBtoDF(self, idx):
-        edge3 = [UB, DR, DF]
-        b = idx % 6
+        edge3 = PERM_UBtoDF[idx % 6]
         a = idx // 6
-        for i in range(12):
-            self.ep[i] = BR
-        for j in range(1, 3):
-            k = b % (j + 1)
-            b //= (j + 1)
-            while k > 0:
-                rotate_right(edge3, 0, j)
-                k -= 1
+        ep = [BR] * 12
         x = 2
         for j in range(11, -1, -1):
-            if a - Cnk(j, x + 1) >= 0:
-                self.ep[j] = edge3[x]
-                a -= Cnk(j, x + 1)
+            if a >= CNK[j][x + 1]:
+                ep[j] = edge3[x]
+                a -= CNK[j][x + 1]
                 x -= 1
+                if x < 0:
+                    break
+        self.ep = ep
     
     def get_URtoDF(self):
-        a, b, x = 0, 0, 0
+        a, x = 0, 0
         edge6 = [0] * 6
         for j in range(12):
             if self.ep[j] <= DF:
-                a += Cnk(j, x + 1)
+                a += CNK[j][x + 1]
                 edge6[x] = self.ep[j]
                 x += 1
-        for j in range(5, 0, -1):
-            k = 0
-            while edge6[j] != j:
-                rotate_left(edge6, 0, j)
-                k += 1
-            b = (j + 1) * b + k
+        b = RANK_URtoDF[tuple(edge6)]
         return 720 * a + b
     
     def set_URtoDF(self, idx):
-        edge6 = [UR, UF, UL, UB, DR, DF]
-        other = [DL, DB, FR, FL, BL, BR]
-        b = idx % 720
+        edge6 = PERM_URtoDF[idx % 720]
         a = idx // 720
-        for i in range(12):
-            self.ep[i] = BR
-        for j in range(1, 6):
-            k = b % (j + 1)
-            b //= (j + 1)
-            while k > 0:
-                rotate_right(edge6, 0, j)
-                k -= 1
+        ep = [BR] * 12
         x = 5
         for j in range(11, -1, -1):
-            if a - Cnk(j, x + 1) >= 0:
-                self.ep[j] = edge6[x]
-                a -= Cnk(j, x + 1)
+            if a >= CNK[j][x + 1]:
+                ep[j] = edge6[x]
+                a -= CNK[j][x + 1]
                 x -= 1
-        x = 0
-        for j in range(12):
-            if self.ep[j] == BR:
-                self.ep[j] = other[x]
-                x += 1
+                if x < 0:
+                    break
+        other = iter((DL, DB, FR, FL, BL, BR))
+        self.ep = [e if e != BR else next(other) for e in ep]
+    
+    def get_edge_coords(self):
+        ep = self.ep
+        slice_pos, ul_pos, df_pos = [], [], []
+        for j, e in enumerate(ep):
+            if e <= UL:
+                ul_pos.append(j)
+            elif e >= FR:
+                slice_pos.append(j)
+            elif UB <= e <= DF:
+                df_pos.append(j)
+        a = 0
+        for x, j in enumerate(reversed(slice_pos)):
+            a += CNK[11 - j][x + 1]
+        FRtoBR = 24 * a + RANK_FRtoBR[tuple([ep[j] for j in slice_pos])]
+        a = 0
+        for x, j in enumerate(ul_pos):
+            a += CNK[j][x + 1]
+        URtoUL = 6 * a + RANK_URtoUL[tuple([ep[j] for j in ul_pos])]
+        a = 0
+        for x, j in enumerate(df_pos):
+            a += CNK[j][x + 1]
+        UBtoDF = 6 * a + RANK_UBtoDF[tuple([ep[j] for j in df_pos])]
+        return FRtoBR, URtoUL, UBtoDF
     
     def to_facecube(self):
-        f = [U] * 54
+        f = bytearray(54)
         f[4] = U
         f[13] = R
         f[22] = F
@@ -385,46 +409,25 @@ class CubieCube:
         f[40] = L
         f[49] = B
         for i in range(8):
-            j = self.cp[i]
-            ori = self.co[i]
-            for n in range(3):
-                f[CORNER_FACELET[i][(n + ori) % 3]] = CORNER_COLOR[j][n]
+            fa, fb, fc = CORNER_FACELET_ORI[i][self.co[i]]
+            f[fa], f[fb], f[fc] = CORNER_COLOR[self.cp[i]]
         for i in range(12):
-            j = self.ep[i]
-            ori = self.eo[i]
-            for n in range(2):
-                f[EDGE_FACELET[i][(n + ori) % 2]] = EDGE_COLOR[j][n]
+            fa, fb = EDGE_FACELET_ORI[i][self.eo[i]]
+            f[fa], f[fb] = EDGE_COLOR[self.ep[i]]
         fc = FaceCube.__new__(FaceCube)
         fc.f = f
         return fc
     
     def verify(self):
-        corner_count = [0] * 8
-        for c in self.cp:
-            if c < 0 or c > 7:
-                return -2
-            corner_count[c] += 1
-        for count in corner_count:
-            if count != 1:
-                return -2
-        edge_count = [0] * 12
-        for e in self.ep:
-            if e < 0 or e > 11:
-                return -1
-            edge_count[e] += 1
-        for count in edge_count:
-            if count != 1:
-                return -1
+        if sorted(self.cp) != [URF, UFL, ULB, UBR, DFR, DLF, DBL, DRB]:
+            return -2
+        if sorted(self.ep) != [UR, UF, UL, UB, DR, DF, DL, DB, FR, FL, BL, BR]:
+            return -1
         if sum(self.co) % 3 != 0:
             return -5
         if sum(self.eo) % 2 != 0:
             return -3
-        edge_parity = 0
-        for i in range(11, 0, -1):
-            for j in range(i - 1, -1, -1):
-                if self.ep[j] > self.ep[i]:
-                    edge_parity += 1
-        if edge_parity % 2 != self.corner_parity():
+        if permutation_parity(self.ep) != self.corner_parity():
             return -6
         return 0
 
@@ -481,11 +484,10 @@ class FaceCube:
     __slots__ = ('f',)
     
     def __init__(self, cube_string="UUUUUUUUURRRRRRRRRFFFFFFFFFDDDDDDDDDLLLLLLLLLBBBBBBBBB"):
-        self.f = [COLORS.get(c, U) for c in cube_string]
+        self.f = bytearray(cube_string, 'latin-1', 'replace').translate(FACELET_TRANS)
     
     def to_string(self):
-        color_names = ['U', 'R', 'F', 'D', 'L', 'B']
-        return ''.join(color_names[c] for c in self.f)
+        return self.f.translate(COLOR_TRANS).decode()
     
     def to_cubie_cube(self):
         cc = CubieCube()
@@ -495,25 +497,50 @@ class FaceCube:
                     break
             col1 = self.f[CORNER_FACELET[i][(ori + 1) % 3]]
             col2 = self.f[CORNER_FACELET[i][(ori + 2) % 3]]
-            for j in range(8):
-                if col1 == CORNER_COLOR[j][1] and col2 == CORNER_COLOR[j][2]:
-                    cc.cp[i] = j
-                    cc.co[i] = ori % 3
-                    break
+            j = CORNER_LOOKUP.get((col1, col2))
+            if j is not None:
+                cc.cp[i] = j
+                cc.co[i] = ori
         for i in range(12):
-            for j in range(12):
-                if (self.f[EDGE_FACELET[i][0]] == EDGE_COLOR[j][0] and
-                    self.f[EDGE_FACELET[i][1]] == EDGE_COLOR[j][1]):
-                    cc.ep[i] = j
-                    cc.eo[i] = 0
-                    break
-                if (self.f[EDGE_FACELET[i][0]] == EDGE_COLOR[j][1] and
-                    self.f[EDGE_FACELET[i][1]] == EDGE_COLOR[j][0]):
-                    cc.ep[i] = j
-                    cc.eo[i] = 1
-                    break
+            fa, fb = EDGE_FACELET[i]
+            found = EDGE_LOOKUP.get((self.f[fa], self.f[fb]))
+            if found is not None:
+                cc.ep[i], cc.eo[i] = found
         return cc
 
+
+@lru_cache(maxsize=1024)
+def _prepare_state(cube_string):
+    if len(cube_string) != 54:
+        return "Error: cubestring doit faire 54 caractères"
+    
+    invalid = cube_string.translate(COLOR_DELETE)
+    if invalid:
+        return f"Error: caractère invalide '{invalid[0]}'"
+    
+    for name in COLOR_NAMES:
+        if cube_string.count(name) != 9:
+            return f"Error: nombre incorrect de '{name}'"
+    
+    fc = FaceCube(cube_string)
+    cc = fc.to_cubie_cube()
+    
+    err = cc.verify()
+    if err != 0:
+        errors = {
+            -1: "Error: arête incorrecte",
+            -2: "Error: coin incorrect",
+            -3: "Error: flip incorrect",
+            -5: "Error: twist incorrect",
+            -6: "Error: parité incorrecte",
+        }
+        return errors.get(err, f"Error: code {err}")
+    
+    FRtoBR, URtoUL, UBtoDF = cc.get_edge_coords()
+    return (cc.get_flip(), cc.get_twist(), cc.corner_parity(), FRtoBR // 24,
+            cc.get_URFtoDLF(), FRtoBR, URtoUL, UBtoDF)
+
+
 # =============================================================================
 # ALGORITHME FAST - DFS avec profondeur max directe
 # =============================================================================
@@ -528,7 +555,7 @@ class SearchFast:
     """
     
     AXIS_NAMES = ('U', 'R', 'F', 'D', 'L', 'B')
-    POWER_NAMES = (None, ' ', '2 ', "' ")
+    MOVE_NAMES = tuple((axis, axis + ' ', axis + '2 ', axis + "' ") for axis in AXIS_NAMES)
     
     def __init__(self, tables):
         self.tables = tables
@@ -547,12 +574,7 @@ class SearchFast:
         self.minDistPhase2 = [0] * 51
     
     def _solution_string(self, length):
-        parts = []
-        for i in range(length):
-            if self.POWER_NAMES[self.po[i]] is not None:
-                parts.append(self.AXIS_NAMES[self.ax[i]] + self.POWER_NAMES[self.po[i]])
-            else:
-                parts.append(self.AXIS_NAMES[self.ax[i]])
+        parts = [self.MOVE_NAMES[ax][po] for ax, po in zip(self.ax[:length], self.po)]
         return ''.join(parts).strip()
     
     def solve(self, cube_string, max_depth=50, timeout=10.0, timeout_per_depth=0.3):
@@ -568,43 +590,14 @@ class SearchFast:
         Returns:
             String de la solution ou message d'erreur
         """
-        if len(cube_string) != 54:
-            return "Error: cubestring doit faire 54 caractères"
-        
-        count = [0] * 6
-        for c in cube_string:
-            if c not in COLORS:
-                return f"Error: caractère invalide '{c}'"
-            count[COLORS[c]] += 1
-        
-        for i in range(6):
-            if count[i] != 9:
-                return f"Error: nombre incorrect de '{COLOR_NAMES[i]}'"
-        
-        fc = FaceCube(cube_string)
-        cc = fc.to_cubie_cube()
-        
-        err = cc.verify()
-        if err != 0:
-            errors = {
-                -1: "Error: arête incorrecte",
-                -2: "Error: coin incorrect",
-                -3: "Error: flip incorrect",
-                -5: "Error: twist incorrect",
-                -6: "Error: parité incorrecte",
-            }
-            return errors.get(err, f"Error: code {err}")
+        state = _prepare_state(cube_string)
+        if isinstance(state, str):
+            return state
         
         self.po[0] = 0
         self.ax[0] = 0
-        self.flip[0] = cc.get_flip()
-        self.twist[0] = cc.get_twist()
-        self.parity[0] = cc.corner_parity()
-        self.slice_[0] = cc.get_FRtoBR() // 24
-        self.URFtoDLF[0] = cc.get_URFtoDLF()
-        self.FRtoBR[0] = cc.get_FRtoBR()
-        self.URtoUL[0] = cc.get_URtoUL()
-        self.UBtoDF[0] = cc.get_UBtoDF()
+        (self.flip[0], self.twist[0], self.parity[0], self.slice_[0],
+         self.URFtoDLF[0], self.FRtoBR[0], self.URtoUL[0], self.UBtoDF[0]) = state
         
         if (self.flip[0] == 0 and self.twist[0] == 0 and 
             self.slice_[0] == 0 and self.FRtoBR[0] == 0 and
@@ -624,28 +617,38 @@ class SearchFast:
         )
         
         depth_phase1 = init_estimate
+        # Démarrer à la profondeur estimée ne doit pas faire descendre la
+        # recherche avant d'avoir joué un vrai coup en position 0 (ax=0, po=0
+        # n'est pas un mouvement et les coordonnées de niveau 1 seraient périmées)
+        self.minDistPhase1[1] = depth_phase1
         
         t_start = time.time()
+        ax, po = self.ax, self.po
+        flip, twist, slice_ = self.flip, self.twist, self.slice_
+        minDistPhase1 = self.minDistPhase1
+        tables = self.tables
+        flip_move, twist_move, slice_move = tables.flip_move, tables.twist_move, tables.slice_move
+        slice_flip_prun, slice_twist_prun = tables.slice_flip_prun, tables.slice_twist_prun
         
         while True:
             t_depth_start = time.time()
             depth_timeout_reached = False
             
             while True:
-                if depth_phase1 - n > self.minDistPhase1[n + 1] and not busy:
-                    if self.ax[n] in (0, 3):
+                if depth_phase1 - n > minDistPhase1[n + 1] and not busy:
+                    if ax[n] in (0, 3):
                         n += 1
-                        self.ax[n] = 1
+                        ax[n] = 1
                     else:
                         n += 1
-                        self.ax[n] = 0
-                    self.po[n] = 1
+                        ax[n] = 0
+                    po[n] = 1
                 else:
-                    self.po[n] += 1
-                    if self.po[n] > 3:
+                    po[n] += 1
+                    if po[n] > 3:
                         while True:
-                            self.ax[n] += 1
-                            if self.ax[n] > 5:
+                            ax[n] += 1
+                            if ax[n] > 5:
                                 if time.time() - t_start > timeout:
                                     return "Error: timeout"
                                 
@@ -655,8 +658,8 @@ class SearchFast:
                                     depth_phase1 += 7
                                     if depth_phase1 > max_depth:
                                         return "Error: pas de solution dans la limite"
-                                    self.ax[n] = 0
-                                    self.po[n] = 1
+                                    ax[n] = 0
+                                    po[n] = 1
                                     busy = False
                                     break
                                 else:
@@ -664,11 +667,10 @@ class SearchFast:
                                     busy = True
                                     break
                             else:
-                                self.po[n] = 1
+                                po[n] = 1
                                 busy = False
                             
-                            if n == 0 or (self.ax[n - 1] != self.ax[n] and 
-                                         self.ax[n - 1] - 3 != self.ax[n]):
+                            if n == 0 or AXIS_OK[ax[n - 1]][ax[n]]:
                                 break
                     else:
                         busy = False
@@ -679,20 +681,21 @@ class SearchFast:
             if depth_timeout_reached:
                 continue
             
-            mv = 3 * self.ax[n] + self.po[n] - 1
-            self.flip[n + 1] = self.tables.flip_move[self.flip[n]][mv]
-            self.twist[n + 1] = self.tables.twist_move[self.twist[n]][mv]
-            self.slice_[n + 1] = self.tables.FRtoBR_move[self.slice_[n] * 24][mv] // 24
+            mv = MV_TABLE[ax[n]][po[n]]
+            flip[n + 1] = flip_move[flip[n]][mv]
+            twist[n + 1] = twist_move[twist[n]][mv]
+            slice_[n + 1] = slice_move[slice_[n]][mv]
             
-            self.minDistPhase1[n + 1] = max(
-                get_pruning(self.tables.slice_flip_prun,
-                           N_SLICE1 * self.flip[n + 1] + self.slice_[n + 1]),
-                get_pruning(self.tables.slice_twist_prun,
-                           N_SLICE1 * self.twist[n + 1] + self.slice_[n + 1])
+            # get_pruning en ligne, sans branche: décalage de 0 ou 4 bits selon la parité
+            idx1 = N_SLICE1 * flip[n + 1] + slice_[n + 1]
+            idx2 = N_SLICE1 * twist[n + 1] + slice_[n + 1]
+            minDistPhase1[n + 1] = max(
+                (slice_flip_prun[idx1 >> 1] >> ((idx1 & 1) << 2)) & 0x0f,
+                (slice_twist_prun[idx2 >> 1] >> ((idx2 & 1) << 2)) & 0x0f
             )
             
-            if self.minDistPhase1[n + 1] == 0:
-                self.minDistPhase1[n + 1] = 10
+            if minDistPhase1[n + 1] == 0:
+                minDistPhase1[n + 1] = 10
                 # Lancer phase 2
                 s = self._phase2(n + 1, max_depth, t_start, timeout, timeout_per_depth)
                 if s == -2:
@@ -703,49 +706,54 @@ class SearchFast:
     def _phase2(self, depth_phase1, max_depth, t_start, timeout, timeout_per_depth):
         """Phase 2: résolution finale dans G1"""
         max_depth_phase2 = min(25, max_depth - depth_phase1)
+        ax, po = self.ax, self.po
+        URFtoDLF, FRtoBR, parity, URtoDF = self.URFtoDLF, self.FRtoBR, self.parity, self.URtoDF
+        minDistPhase2 = self.minDistPhase2
+        tables = self.tables
+        URFtoDLF_move, FRtoBR_move, URtoDF_move = tables.URFtoDLF_move, tables.FRtoBR_move, tables.URtoDF_move
+        slice_URFtoDLF_parity_prun = tables.slice_URFtoDLF_parity_prun
+        slice_URtoDF_parity_prun = tables.slice_URtoDF_parity_prun
         
         for i in range(depth_phase1):
-            mv = 3 * self.ax[i] + self.po[i] - 1
-            self.URFtoDLF[i + 1] = self.tables.URFtoDLF_move[self.URFtoDLF[i]][mv]
-            self.FRtoBR[i + 1] = self.tables.FRtoBR_move[self.FRtoBR[i]][mv]
-            self.parity[i + 1] = PARITY_MOVE[self.parity[i]][mv]
+            mv = MV_TABLE[ax[i]][po[i]]
+            URFtoDLF[i + 1] = URFtoDLF_move[URFtoDLF[i]][mv]
+            FRtoBR[i + 1] = FRtoBR_move[FRtoBR[i]][mv]
+            parity[i + 1] = PARITY_MOVE[parity[i]][mv]
         
-        if self.FRtoBR[depth_phase1] >= N_SLICE2:
+        if FRtoBR[depth_phase1] >= N_SLICE2:
             return -1
         
-        idx1 = (N_SLICE2 * self.URFtoDLF[depth_phase1] + self.FRtoBR[depth_phase1]) * 2 + self.parity[depth_phase1]
-        d1 = get_pruning(self.tables.slice_URFtoDLF_parity_prun, idx1)
+        idx1 = (N_SLICE2 * URFtoDLF[depth_phase1] + FRtoBR[depth_phase1]) * 2 + parity[depth_phase1]
+        d1 = get_pruning(slice_URFtoDLF_parity_prun, idx1)
         if d1 > max_depth_phase2:
             return -1
         
         for i in range(depth_phase1):
-            mv = 3 * self.ax[i] + self.po[i] - 1
-            self.URtoUL[i + 1] = self.tables.URtoUL_move[self.URtoUL[i]][mv]
-            self.UBtoDF[i + 1] = self.tables.UBtoDF_move[self.UBtoDF[i]][mv]
+            mv = MV_TABLE[ax[i]][po[i]]
+            self.URtoUL[i + 1] = tables.URtoUL_move[self.URtoUL[i]][mv]
+            self.UBtoDF[i + 1] = tables.UBtoDF_move[self.UBtoDF[i]][mv]
         
-        rows_merge = len(self.tables.merge_URtoUL_UBtoDF)
-        cols_merge = len(self.tables.merge_URtoUL_UBtoDF[0]) if rows_merge > 0 else 0
-        if (self.URtoUL[depth_phase1] >= rows_merge or
-            self.UBtoDF[depth_phase1] >= cols_merge):
+        if (self.URtoUL[depth_phase1] >= N_MERGE or
+            self.UBtoDF[depth_phase1] >= N_MERGE):
             return -1
-        self.URtoDF[depth_phase1] = self.tables.merge_URtoUL_UBtoDF[
-            self.URtoUL[depth_phase1]][self.UBtoDF[depth_phase1]]
+        URtoDF[depth_phase1] = tables.merge_URtoUL_UBtoDF_flat[
+            self.URtoUL[depth_phase1] * N_MERGE + self.UBtoDF[depth_phase1]]
         
-        idx2 = (N_SLICE2 * self.URtoDF[depth_phase1] + self.FRtoBR[depth_phase1]) * 2 + self.parity[depth_phase1]
-        d2 = get_pruning(self.tables.slice_URtoDF_parity_prun, idx2)
+        idx2 = (N_SLICE2 * URtoDF[depth_phase1] + FRtoBR[depth_phase1]) * 2 + parity[depth_phase1]
+        d2 = get_pruning(slice_URtoDF_parity_prun, idx2)
         if d2 > max_depth_phase2:
             return -1
         
-        self.minDistPhase2[depth_phase1] = max(d1, d2)
-        if self.minDistPhase2[depth_phase1] == 0:
+        minDistPhase2[depth_phase1] = max(d1, d2)
+        if minDistPhase2[depth_phase1] == 0:
             return depth_phase1
         
         depth_phase2 = 1
         n = depth_phase1
         busy = False
-        self.po[depth_phase1] = 0
-        self.ax[depth_phase1] = 0
-        self.minDistPhase2[n + 1] = 1
+        po[depth_phase1] = 0
+        ax[depth_phase1] = 0
+        minDistPhase2[n + 1] = 1
         
         # Timeout par profondeur en phase 2
 
@@ -754,25 +762,25 @@ class SearchFast:
         
         while True:
             while True:
-                if depth_phase1 + depth_phase2 - n > self.minDistPhase2[n + 1] and not busy:
-                    if self.ax[n] in (0, 3):
+                if depth_phase1 + depth_phase2 - n > minDistPhase2[n + 1] and not busy:
+                    if ax[n] in (0, 3):
                         n += 1
-                        self.ax[n] = 1
-                        self.po[n] = 2
+                        ax[n] = 1
+                        po[n] = 2
                     else:
                         n += 1
-                        self.ax[n] = 0
-                        self.po[n] = 1
+                        ax[n] = 0
+                        po[n] = 1
                 else:
-                    if self.ax[n] in (0, 3):
-                        self.po[n] += 1
+                    if ax[n] in (0, 3):
+                        po[n] += 1
                     else:
-                        self.po[n] += 2
+                        po[n] += 2
                     
-                    if self.po[n] > 3:
+                    if po[n] > 3:
                         while True:
-                            self.ax[n] += 1
-                            if self.ax[n] > 5:
+                            ax[n] += 1
+                            if ax[n] > 5:
                                 if time.time() - t_start > timeout:
                                     return -2
                                 
@@ -783,8 +791,8 @@ class SearchFast:
                                     if depth_phase2 >= max_depth_phase2:
                                         return -1
                                     depth_phase2 += 1
-                                    self.ax[n] = 0
-                                    self.po[n] = 1
+                                    ax[n] = 0
+                                    po[n] = 1
                                     busy = False
                                     break
                                 else:
@@ -792,14 +800,13 @@ class SearchFast:
                                     busy = True
                                     break
                             else:
-                                if self.ax[n] in (0, 3):
-                                    self.po[n] = 1
+                                if ax[n] in (0, 3):
+                                    po[n] = 1
                                 else:
-                                    self.po[n] = 2
+                                    po[n] = 2
                                 busy = False
                             
-                            if n == depth_phase1 or (self.ax[n - 1] != self.ax[n] and
-                                                      self.ax[n - 1] - 3 != self.ax[n]):
+                            if n == depth_phase1 or AXIS_OK[ax[n - 1]][ax[n]]:
                                 break
                     else:
                         busy = False
@@ -812,21 +819,21 @@ class SearchFast:
                 depth_timeout_reached = False
                 continue
             
-            mv = 3 * self.ax[n] + self.po[n] - 1
-            self.URFtoDLF[n + 1] = self.tables.URFtoDLF_move[self.URFtoDLF[n]][mv]
-            self.FRtoBR[n + 1] = self.tables.FRtoBR_move[self.FRtoBR[n]][mv]
-            self.parity[n + 1] = PARITY_MOVE[self.parity[n]][mv]
-            self.URtoDF[n + 1] = self.tables.URtoDF_move[self.URtoDF[n]][mv]
+            mv = MV_TABLE[ax[n]][po[n]]
+            URFtoDLF[n + 1] = URFtoDLF_move[URFtoDLF[n]][mv]
+            FRtoBR[n + 1] = FRtoBR_move[FRtoBR[n]][mv]
+            parity[n + 1] = PARITY_MOVE[parity[n]][mv]
+            URtoDF[n + 1] = URtoDF_move[URtoDF[n]][mv]
             
-            idx1 = (N_SLICE2 * self.URFtoDLF[n + 1] + self.FRtoBR[n + 1]) * 2 + self.parity[n + 1]
-            idx2 = (N_SLICE2 * self.URtoDF[n + 1] + self.FRtoBR[n + 1]) * 2 + self.parity[n + 1]
+            idx1 = (N_SLICE2 * URFtoDLF[n + 1] + FRtoBR[n + 1]) * 2 + parity[n + 1]
+            idx2 = (N_SLICE2 * URtoDF[n + 1] + FRtoBR[n + 1]) * 2 + parity[n + 1]
             
-            self.minDistPhase2[n + 1] = max(
-                get_pruning(self.tables.slice_URFtoDLF_parity_prun, idx1),
-                get_pruning(self.tables.slice_URtoDF_parity_prun, idx2)
+            minDistPhase2[n + 1] = max(
+                (slice_URFtoDLF_parity_prun[idx1 >> 1] >> ((idx1 & 1) << 2)) & 0x0f,
+                (slice_URtoDF_parity_prun[idx2 >> 1] >> ((idx2 & 1) << 2)) & 0x0f
             )
             
-            if self.minDistPhase2[n + 1] == 0:
+            if minDistPhase2[n + 1] == 0:
                 return depth_phase1 + depth_phase2
 
 
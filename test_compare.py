@@ -16,8 +16,8 @@ import argparse
 
 # Import des deux solvers
 from solver_kociemba import solve as solve_optimal
-from solver_kociemba import CubieCube, MOVE_CUBE
 from solver_kociemba_fast import solve_fast
+from solver_driver import apply_moves
 
 # Mouvements possibles
 MOVES = ["U", "U'", "U2", "D", "D'", "D2", 
@@ -38,34 +38,9 @@ def generate_shuffle(num_moves):
     
     return " ".join(shuffle)
 
-MOVE_INDEX = {"U": 0, "R": 1, "F": 2, "D": 3, "L": 4, "B": 5}
-
-def _apply_move(cube, move):
-    """Applique un mouvement (ex: U, U2, U') au CubieCube."""
-    if not move:
-        return
-    face = move[0]
-    axis = MOVE_INDEX.get(face)
-    if axis is None:
-        return
-    suffix = move[1:] if len(move) > 1 else ""
-    if suffix == "2":
-        turns = 2
-    elif suffix == "'":
-        turns = 3
-    else:
-        turns = 1
-    for _ in range(turns):
-        cube.multiply(MOVE_CUBE[axis])
-
 def get_cubestring(shuffle):
     """Applique le shuffle et retourne le cubestring."""
-    cc = CubieCube()
-    if shuffle:
-        for mv in shuffle.split():
-            _apply_move(cc, mv)
-    fc = cc.to_facecube()
-    return fc.to_string()
+    return apply_moves(shuffle).to_facecube().to_string()
 
 def test_single(cubestring, timeout_optimal=30.0, timeout_fast=3.0):
     """
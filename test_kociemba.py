@@ -1,47 +1,8 @@
 #!/usr/bin/env python3
 """Test complet du solveur Kociemba avec différents niveaux de difficulté"""
 
-import time
 import random
-from solver_kociemba import CubieCube, MOVE_CUBE, solve
-
-# Noms des mouvements
-MOVE_NAMES = ["U", "R", "F", "D", "L", "B"]
-
-
-def apply_moves(scramble: str) -> CubieCube:
-    """Applique une séquence de mouvements à un cube résolu"""
-    cc = CubieCube()
-    moves = scramble.split()
-    
-    for move in moves:
-        if not move:
-            continue
-        
-        # Parser le mouvement
-        face = move[0]
-        if face not in MOVE_NAMES:
-            print(f"Mouvement inconnu: {move}")
-            continue
-        
-        face_idx = MOVE_NAMES.index(face)
-        
-        # Déterminer le nombre de rotations
-        if len(move) == 1:
-            count = 1  # U = 1 fois
-        elif move[1] == "'":
-            count = 3  # U' = 3 fois (équivalent à -1)
-        elif move[1] == "2":
-            count = 2  # U2 = 2 fois
-        else:
-            count = 1
-        
-        # Appliquer le mouvement
-        for _ in range(count):
-            cc.multiply(MOVE_CUBE[face_idx])
-    
-    return cc
-
+from solver_driver import MOVE_NAMES, run_solver
 
 def generate_random_scramble(n_moves: int) -> str:
     """Génère un scramble aléatoire de n mouvements"""
@@ -68,55 +29,7 @@ def test_scramble(name: str, scramble: str, timeout: float = 120.0) -> dict:
     print(f"Scramble: {scramble}")
     print(f"Nombre de mouvements: {len(scramble.split())}")
     
-    # Appliquer le scramble
-    cc = apply_moves(scramble)
-    fc = cc.to_facecube()
-    cubestring = fc.to_string()
-    print(f"Cubestring: {cubestring}")
-    
-    # Résoudre
-    start = time.time()
-    try:
-        solution = solve(cubestring, max_depth=24, timeout=timeout)
-        elapsed = time.time() - start
-        
-        if solution.startswith("Error"):
-            print(f"❌ ERREUR: {solution}")
-            return {"success": False, "error": solution, "time": elapsed}
-        
-        sol_moves = len(solution.split()) if solution else 0
-        print(f"✅ Solution: {solution}")
-        print(f"   Longueur: {sol_moves} mouvements")
-        print(f"   Temps: {elapsed:.3f}s")
-        
-        # Vérifier la solution
-        verify_cc = apply_moves(scramble)
-        # Appliquer la solution au cube scramblé
-        for move in solution.split():
-            if not move:
-                continue
-            face = move[0]
-            face_idx = MOVE_NAMES.index(face)
-            count = 1 if len(move) == 1 else (3 if move[1] == "'" else 2)
-            for _ in range(count):
-                verify_cc.multiply(MOVE_CUBE[face_idx])
-        
-        # Vérifier si résolu
-        verify_fc = verify_cc.to_facecube()
-        verify_str = verify_fc.to_string()
-        solved_str = "UUUUUUUUURRRRRRRRRFFFFFFFFFDDDDDDDDDLLLLLLLLLBBBBBBBBB"
-        
-        if verify_str == solved_str:
-            print(f"   ✓ Solution vérifiée correcte!")
-        else:
-            print(f"   ⚠ Solution non vérifiée (résultat: {verify_str})")
-        
-        return {"success": True, "solution": solution, "moves": sol_moves, "time": elapsed}
-        
-    except Exception as e:
-        elapsed = time.time() - start
-        print(f"❌ EXCEPTION: {e}")
-        return {"success": False, "error": str(e), "time": elapsed}
+    return run_solver(scramble, max_depth=24, timeout=timeout, verify=True)
 
 
 def main():